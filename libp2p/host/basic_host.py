@@ -761,11 +761,10 @@ class BasicHost(IHost):
             muxed_conn = getattr(net_stream, "muxed_conn", None)
             if muxed_conn is not None:
                 connection_type = type(muxed_conn).__name__
-                if hasattr(muxed_conn, "is_established"):
+                established = getattr(muxed_conn, "is_established", None)
+                if established is not None:
                     is_established = (
-                        muxed_conn.is_established
-                        if not callable(muxed_conn.is_established)
-                        else muxed_conn.is_established()
+                        established() if callable(established) else established
                     )
                 if hasattr(muxed_conn, "_handshake_completed"):
                     handshake_completed = muxed_conn._handshake_completed
@@ -1102,8 +1101,13 @@ class BasicHost(IHost):
         # This matches the client-side protection for symmetric behavior
         muxed_conn = getattr(net_stream, "muxed_conn", None)
         negotiation_semaphore = None
+        server_semaphore = None
         if muxed_conn is not None:
             negotiation_semaphore = getattr(muxed_conn, "_negotiation_semaphore", None)
+            if negotiation_semaphore is not None:
+                server_semaphore = getattr(
+                    muxed_conn, "_server_negotiation_semaphore", None
+                )
 
         try:
             if negotiation_semaphore is not None:
@@ -1112,12 +1116,6 @@ class BasicHost(IHost):
                 # when many streams arrive simultaneously.
                 # Use separate server semaphore to avoid deadlocks
                 # with client negotiations.
-                muxed_conn = getattr(net_stream, "muxed_conn", None)
-                server_semaphore = None
-                if muxed_conn is not None:
-                    server_semaphore = getattr(
-                        muxed_conn, "_server_negotiation_semaphore", None
-                    )
                 # Fallback to shared semaphore if server semaphore not available
                 semaphore_to_use = server_semaphore or negotiation_semaphore
                 async with semaphore_to_use:
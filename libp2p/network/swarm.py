@@ -1450,6 +1450,9 @@ class Swarm(Service, INetworkService):
         """
         # Apply resource manager checks to ALL connection types (TCP, WebSocket, QUIC)
         conn_scope = None
+        # Resolve the scope hook once; QUICConnection provides it, other muxers
+        # rely on SwarmConn to own the scope instead.
+        set_resource_scope = getattr(muxed_conn, "set_resource_scope", None)
         if self._resource_manager is not None:
             try:
                 # Extract peer_id from any muxed connection type
@@ -1465,9 +1468,8 @@ class Swarm(Service, INetworkService):
                         "Connection denied by resource manager: resource limit exceeded"
                     )
                 # QUICConnection provides a hook to set scope and ensure cleanup
-                if hasattr(muxed_conn, "set_resource_scope"):
-                    # Type ignore: we've checked the attribute exists
-                    muxed_conn.set_resource_scope(conn_scope)  # type: ignore
+                if set_resource_scope is not None:
+                    set_resource_scope(conn_scope)
             except Exception as e:
                 # If resource guard denies, close connection and rethrow
                 try:
@@ -1509,7 +1511,7 @@ class Swarm(Service, INetworkService):
             )
 
         # For non-QUIC connections, set the resource scope on SwarmConn
-        if conn_scope is not None and not hasattr(muxed_conn, "set_resource_scope"):
+        if conn_scope is not None and set_resource_scope is None:
             swarm_conn.set_resource_scope(conn_scope)  # type: ignore
         logger.debug("Swarm::add_conn | starting muxed connection")
         self.manager.run_task(muxed_conn.start)
@@ -504,9 +504,10 @@ class QUICStream(IMuxedStream):
             if not self._connection.is_established:
                 # Wait for connection to be established using the connection's event
                 # This is event-driven, not polling
-                if hasattr(self._connection, "_connected_event"):
+                connected_event = getattr(self._connection, "_connected_event", None)
+                if connected_event is not None:
                     with trio.move_on_after(timeout):
-                        await self._connection._connected_event.wait()
+                        await connected_event.wait()
                     if not self._connection.is_established:
                         raise QUICStreamTimeoutError(
                             f"Stream not ready: connection not established "